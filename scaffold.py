@@ -0,0 +1,193 @@
+# cython: language_level=3
+# Compile with `cythonize -i scaffold.py` to skip bytecode dispatch; the built
+# extension shadows this module on import and this file stays the fallback.
+import asyncio
+import os
+import platform
+import re
+import stat
+import subprocess
+import sys
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+URING_QUEUE_DEPTH = 128
+COMMAND_BATCH_SIZE = 500
+
+
+def uring_supported() -> bool:
+    # IORING_OP_MKDIRAT is only available on Linux 5.15 and newer
+    if liburing is None or not sys.platform.startswith("linux"):
+        return False
+    match = re.match(r"(\d+)\.(\d+)", platform.release())
+    return match is not None and tuple(map(int, match.groups())) >= (5, 15)
+
+
+def uring_submit(ring, cqe, ops: list) -> list:
+    # Queue one SQE per (prep function, arguments) pair, submitting a full
+    # ring at a time, and return each result (or its OSError) in order
+    results = []
+    for start in range(0, len(ops), URING_QUEUE_DEPTH):
+        batch = ops[start:start + URING_QUEUE_DEPTH]
+        for index, (prep, args) in enumerate(batch):
+            sqe = liburing.io_uring_get_sqe(ring)
+            prep(sqe, *args)
+            sqe.user_data = index
+        liburing.io_uring_submit_and_wait(ring, len(batch))
+        batch_results = [None] * len(batch)
+        for _ in range(len(batch)):
+            liburing.io_uring_wait_cqe(ring, cqe)
+            entry = cqe[0]
+            index = entry.user_data
+            try:
+                batch_results[index] = entry.res
+            except OSError as e:
+                batch_results[index] = e
+            liburing.io_uring_cqe_seen(ring, entry)
+        results.extend(batch_results)
+    return results
+
+
+def create_with_uring(levels: list) -> bool:
+    # Submit each level's mkdirs and file opens as one batch (they only depend
+    # on the level above), then close the new files before descending.
+    # Returns False when io_uring can't be used so the caller can fall back.
+    if not uring_supported():
+        return False
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(URING_QUEUE_DEPTH, ring)
+    except OSError:
+        return False
+    # O_EXCL leaves files that already exist untouched
+    flags = liburing.O_CREAT | liburing.O_EXCL | liburing.O_WRONLY
+    try:
+        for dirs, files in levels:
+            ops = [(liburing.io_uring_prep_mkdir, (path, 0o755)) for path in dirs]
+            ops += [(liburing.io_uring_prep_open, (path, flags, 0o644)) for path in files]
+            results = uring_submit(ring, cqe, ops)
+            closes = [
+                (liburing.io_uring_prep_close, (fd,))
+                for fd in results[len(dirs):]
+                if not isinstance(fd, OSError)
+            ]
+            uring_submit(ring, cqe, closes)
+            for result in results:
+                if isinstance(result, OSError) and not isinstance(result, FileExistsError):
+                    raise result
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def run_batched(command: list, args: list) -> None:
+    # Chunk the arguments to stay well below ARG_MAX
+    for start in range(0, len(args), COMMAND_BATCH_SIZE):
+        subprocess.run([*command, "--", *args[start:start + COMMAND_BATCH_SIZE]], check=True)
+
+
+def create_with_commands(levels: list) -> bool:
+    # Hand all directories to one `mkdir -p` and all files to one `touch`, so
+    # the per-path work happens in C rather than in Python. Returns False when
+    # the commands aren't available (e.g. on Windows).
+    try:
+        run_batched(["mkdir", "-p"], [path for dirs, _ in levels for path in dirs])
+        run_batched(["touch"], [path for _, files in levels for path in files])
+    except OSError:
+        return False
+    return True
+
+
+def create_file(path: str) -> None:
+    # mknod materializes an empty regular file in one syscall without opening
+    # it. Files that already exist are left alone, and platforms where mknod
+    # is missing or privileged (Windows, macOS) use a plain open/close pair.
+    try:
+        try:
+            os.mknod(path, stat.S_IFREG | 0o644)
+        except (AttributeError, PermissionError):
+            os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+    except FileExistsError:
+        pass
+
+
+async def create_levels(levels: list, fresh: bool) -> None:
+    # Everything in a level only depends on the level above, so create its
+    # directories and files concurrently before moving on to their children.
+    # Under a freshly created base directory nothing can exist yet, so there
+    # are no EEXIST results to filter and any error simply propagates.
+    loop = asyncio.get_running_loop()
+    for dirs, files in levels:
+        tasks = [
+            *[loop.run_in_executor(None, os.mkdir, path, 0o755) for path in dirs],
+            *[loop.run_in_executor(None, create_file, path) for path in files],
+        ]
+        if fresh:
+            await asyncio.gather(*tasks)
+            continue
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, FileExistsError):
+                raise result
+
+
+def iter_entries(spec_paths: tuple):
+    # Stream (relative path, is_dir) pairs from spec files holding one path
+    # per line, where directory paths end with "/"
+    for spec_path in spec_paths:
+        with open(spec_path) as f:
+            for line in f:
+                path = line.rstrip("\n")
+                if path:
+                    yield (path[:-1], True) if path[-1] == "/" else (path, False)
+
+
+async def create_structure(base_dir: str, *spec_paths: str) -> None:
+    # Bucket directories and files by depth into (dirs, files) levels, so a
+    # directory's files are created right after the directory itself and
+    # parents always come before children. Each full path is a single
+    # concatenation onto the shared prefix.
+    prefix = base_dir + os.sep
+    expected = set()
+    levels = []
+    for path, is_dir in iter_entries(spec_paths):
+        expected.add(path.partition("/")[0])
+        depth = path.count("/")
+        while len(levels) <= depth:
+            levels.append(([], []))
+        levels[depth][0 if is_dir else 1].append(prefix + path)
+
+    # Sorting keeps siblings, and children of the same parent, next to each
+    # other so the parent's dentry stays hot while they are created
+    for dirs, _ in levels:
+        dirs.sort()
+
+    # A re-run finds every top-level entry already in place; skip it without
+    # touching the rest of the tree
+    base_exists = True
+    try:
+        with os.scandir(base_dir) as entries:
+            existing = {entry.name for entry in entries}
+    except FileNotFoundError:
+        base_exists = False
+        existing = set()
+    if expected <= existing:
+        print(f"Directory structure already exists at {base_dir}")
+        return
+
+    # The probe above already knows whether base_dir is there, so only a
+    # missing base directory (and its parents) costs a makedirs
+    if not base_exists:
+        os.makedirs(base_dir, exist_ok=True)
+
+    # Batch every mkdir/open/close through io_uring when the kernel supports
+    # it, then try mkdir/touch, and otherwise create each level concurrently
+    # from Python
+    if not create_with_uring(levels) and not create_with_commands(levels):
+        await create_levels(levels, fresh=not base_exists)
+
+    print(f"Directory structure created successfully at {base_dir}")
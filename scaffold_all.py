@@ -0,0 +1,16 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import admin
+import web
+
+
+def main():
+    # The admin and web trees share nothing, so build them in parallel
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(admin.main), executor.submit(web.main)]
+        for future in futures:
+            future.result()
+
+
+if __name__ == "__main__":
+    main()